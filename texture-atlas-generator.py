@@ -40,11 +40,19 @@ generating a texture atlas from the selected image sequence, storing it as a new
 
 import bpy
 
+try:
+    import numpy as np
+except ImportError:
+    np = None # Fall back to array.array pixel buffers
+
+from array import array
 from time import time, sleep
-from math import ceil, floor
-from os import listdir
-from os.path import dirname, isfile, isdir, join
-from re import compile, search
+from collections import defaultdict
+from os import scandir, stat
+from os.path import dirname, isdir, join
+from re import compile
+from stat import S_ISDIR
+from struct import unpack
 from bpy.props import BoolProperty, IntProperty, StringProperty, EnumProperty, CollectionProperty, PointerProperty
 from bpy.types import PropertyGroup
 
@@ -54,31 +62,68 @@ r_last_numerical = compile('(\d+)\D*$')
 
 # Cache for detected image sequence files (to minimize IO operations)
 cached_image_sequences = {}
-cached_image_sequences_path = None
+cached_image_sequence_counts = {}
+cached_image_sequences_key = None
 cached_image_sequences_dirty = False
 
+# Cache for sequence enum items, built from the image sequences they were generated for
+# (Blender also requires Python to keep references to dynamic enum item strings)
+cached_sequence_items = []
+cached_sequence_items_source = None
+
+
+def get_image_sequences_cache_key(path):
+    """
+    Returns the cache key for the image sequences in folder.
+    The key consists of the path and the modification time of the folder,
+    which changes whenever files are added, removed or renamed.
+    
+    """
+    try:
+        path_stat = stat(path.strip())
+    except OSError:
+        return (path, 0)
+    
+    if S_ISDIR(path_stat.st_mode):
+        return (path, path_stat.st_mtime_ns)
+    
+    return (path, 0)
+
 
 def get_image_sequences_in_folder(path):
     """
     Returns image sequences in folder.
     See discover_image_sequences_in_folder(path) for details on evaluation.
     Caches evaluated image sequences for last specified path.
-    Re-Evaluates when the path is different to the last cached one or
+    Re-Evaluates when the path or its modification time is different to the last cached one or
     global cached_image_sequences_dirty is True.
     
     """
     global cached_image_sequences
-    global cached_image_sequences_path
+    global cached_image_sequence_counts
+    global cached_image_sequences_key
     global cached_image_sequences_dirty
     
-    if path != cached_image_sequences_path or cached_image_sequences_dirty:
+    key = get_image_sequences_cache_key(path)
+    if key != cached_image_sequences_key or cached_image_sequences_dirty:
         cached_image_sequences = discover_image_sequences_in_folder(path)
-        cached_image_sequences_path = path
+        cached_image_sequence_counts = {schema: len(images) for schema, images in cached_image_sequences.items()}
+        cached_image_sequences_key = key
         cached_image_sequences_dirty = False
     
     return cached_image_sequences
 
 
+def get_image_sequence_counts(path):
+    """
+    Returns the number of images of each image sequence in folder.
+    Cached alongside the image sequences, see get_image_sequences_in_folder(path).
+    
+    """
+    get_image_sequences_in_folder(path)
+    return cached_image_sequence_counts
+
+
 def discover_image_sequences_in_folder(path):
     """
     Searches image sequences in folder and returns them.
@@ -88,22 +133,71 @@ def discover_image_sequences_in_folder(path):
     Filenames that evaluated to the same mask are grouped together.
     
     """
-    image_sequences = {} # {SCHEMA: [(frameno, file)]]} (Possibly unsorted)
+    image_sequences = defaultdict(list) # {SCHEMA: [(frameno, file)]]} (Possibly unsorted)
     
     path = path.strip()
     if isdir(path):
-        files = [f for f in listdir(path) if isfile(join(path, f))]
+        with scandir(path) as entries:
+            files = [entry.name for entry in entries if entry.is_file()]
+        search_last_numerical = r_last_numerical.search
         for file in files:
-            match = search(r_last_numerical, file)
+            match = search_last_numerical(file)
             schema = file[:match.start(1)] + '#' + file[match.end(1):]
             frame = int(match.group(1))
-            
-            if schema not in image_sequences.keys():
-                image_sequences[schema] = [(frame, file)]
-            else:
-                image_sequences[schema].append((frame, file))
+            image_sequences[schema].append((frame, file))
     
-    return image_sequences
+    # Plain dict, so lookups of unknown schemas don't insert empty sequences
+    return dict(image_sequences)
+
+
+def copy_tile_to_tilemap(tilemap_grid, tile_pixels, row_index, column_index):
+    """
+    Copies the pixels of a tile into its slot of the tilemap.
+    tilemap_grid is a (rows, slot height, columns, slot width, 4) view of the tilemap pixels,
+    tile_pixels a (height, width, 4) array of R G B A components.
+    Tiles smaller than a slot are placed in its bottom-left corner.
+    The copy is a single block assignment, executed by NumPy without per-pixel Python work.
+    
+    """
+    tile_height, tile_width = tile_pixels.shape[:2]
+    tilemap_grid[row_index, :tile_height, column_index, :tile_width] = tile_pixels
+
+
+def copy_tile_to_tilemap_buffer(tilemap_view, tilemap_width, tile_view, tile_size, slot_size, row_index, column_index):
+    """
+    Copies the pixels of a tile into its slot of the tilemap, used when NumPy is not available.
+    tilemap_view and tile_view are flat memoryviews of R G B A components.
+    Tiles smaller than a slot are placed in its bottom-left corner.
+    Copies line by line, each line is a single memoryview slice assignment.
+    
+    """
+    tile_width, tile_height = tile_size
+    tile_line_length = tile_width * 4
+    tilemap_line_length = tilemap_width * 4
+    tile_offset = 0
+    tilemap_offset = (row_index * slot_size[1] * tilemap_width + column_index * slot_size[0]) * 4
+    for y in range(0, tile_height):
+        tilemap_view[tilemap_offset:tilemap_offset + tile_line_length] = tile_view[tile_offset:tile_offset + tile_line_length]
+        tile_offset += tile_line_length
+        tilemap_offset += tilemap_line_length
+
+
+def read_png_header(path):
+    """
+    Returns (width, height) of a PNG file, read from its header without decoding pixels.
+    Returns None if the file is no PNG or can't be read.
+    
+    """
+    try:
+        with open(path, 'rb') as file:
+            header = file.read(24) # Signature, IHDR length, type, width and height
+    except OSError:
+        return None
+    
+    if len(header) < 24 or header[:8] != b'\x89PNG\r\n\x1a\n' or header[12:16] != b'IHDR':
+        return None
+    
+    return unpack('>II', header[16:24])
 
 
 class TEXTURE_ATLAS_GENERATOR_Properties(PropertyGroup):
@@ -126,16 +220,22 @@ class TEXTURE_ATLAS_GENERATOR_Properties(PropertyGroup):
     )
     
     def sequence_items(self, context):
-        items = []
+        global cached_sequence_items
+        global cached_sequence_items_source
         
         image_sequences = get_image_sequences_in_folder(self.path)
-        for schema, images in image_sequences.items():
-            items += [(schema, f"{schema} ({len(images)})", f"Sequence with Schema '{schema}' containing {len(images)} Images.")]
-        
-        if len(items) == 0:
-            items += [('none', "", "No Image Sequence found.")]
+        if image_sequences is not cached_sequence_items_source:
+            items = []
+            for schema, images in image_sequences.items():
+                items.append((schema, f"{schema} ({len(images)})", f"Sequence with Schema '{schema}' containing {len(images)} Images."))
+            
+            if len(items) == 0:
+                items.append(('none', "", "No Image Sequence found."))
+            
+            cached_sequence_items = items
+            cached_sequence_items_source = image_sequences
         
-        return items
+        return cached_sequence_items
     
     sequence : EnumProperty(
         name = "",
@@ -144,13 +244,7 @@ class TEXTURE_ATLAS_GENERATOR_Properties(PropertyGroup):
     )
     
     def image_count_get(self):
-        count = 0
-        
-        image_sequences = get_image_sequences_in_folder(self.path)
-        if self.sequence in image_sequences.keys():
-            count = len(image_sequences[self.sequence])
-        
-        return count
+        return get_image_sequence_counts(self.path).get(self.sequence, 0)
     
     image_count : IntProperty(
         name = "Image Count",
@@ -165,7 +259,7 @@ class TEXTURE_ATLAS_GENERATOR_Properties(PropertyGroup):
     )
     
     def row_count_get(self):
-        return ceil(self.image_count / self.column_count)
+        return -(-self.image_count // self.column_count) # Ceiling division
     
     row_count : IntProperty(
         name = "Rows",
@@ -205,6 +299,7 @@ class TEXTURE_ATLAS_GENERATOR_PT_generator_panel(bpy.types.Panel):
     
     def draw(self, context):
         props = context.scene.texture_atlas_generator
+        image_sequences = get_image_sequences_in_folder(props.path) # Evaluated once per redraw
         
         # Output path select
         col = self.layout.column(align=True)
@@ -221,7 +316,7 @@ class TEXTURE_ATLAS_GENERATOR_PT_generator_panel(bpy.types.Panel):
         
         # Image Sequence selection
         col = self.layout.column(align=True)
-        sequence_count = len([item for item in props.sequence_items(context) if item[0] != 'none'])
+        sequence_count = len(image_sequences)
         col.label(text=f"Found {sequence_count} Image Sequence{'s' if sequence_count != 1 else ''}")
         row = col.row(align=True)
         row.prop(props, 'sequence')
@@ -233,14 +328,17 @@ class TEXTURE_ATLAS_GENERATOR_PT_generator_panel(bpy.types.Panel):
         
         # Tiling information
         col = self.layout.column(align=True)
-        col.label(text=f"Found {props.image_count} Images in Sequence")
+        image_count = props.image_count
+        column_count = props.column_count
+        row_count = props.row_count
+        col.label(text=f"Found {image_count} Images in Sequence")
         row = col.row(align=True)
         row.prop(props, 'column_count')
         row = col.row(align=True)
         row.prop(props, 'row_count')
         row.enabled = False # Only display
-        if props.image_count > 0:
-            unused_tiles = props.column_count * props.row_count - props.image_count
+        if image_count > 0:
+            unused_tiles = column_count * row_count - image_count
             if unused_tiles > 0:
                 self.layout.label(text=f"{unused_tiles} empty Tile{'s' if unused_tiles != 1 else ''}!", icon='INFO')
         col.prop(props, 'row_order')
@@ -291,25 +389,30 @@ class TEXTURE_ATLAS_GENERATOR_OT_generate_texture_atlas(bpy.types.Operator):
         folder_path = props.path
         image_sequences = get_image_sequences_in_folder(folder_path)
         sequence = props.sequence
-        files = [file for frame, file in sorted(image_sequences[sequence], key = lambda x: x[1])]
+        files = [file for frame, file in sorted(image_sequences[sequence])] # Sorted by frame number
         output_name = props.output_name
         overwrite_existing = props.overwrite_existing
-        row_count = props.row_count
         column_count = props.column_count
+        row_count = -(-len(files) // column_count) # From files, the sequence cache may refresh in between
         row_order = props.row_order
         
         wm = context.window_manager
         wm.progress_begin(0, len(files))
         
-        # Load tile images, get max size while doing so
-        images = []
+        # Determine max tile size
+        # PNG headers are read directly, other formats are loaded one tile image at a time
         max_size = [0, 0]
         for file in files:
-            img = bpy.data.images.load(join(folder_path, file))
-            max_size[0] = img.size[0] if img.size[0] > max_size[0] else max_size[0]
-            max_size[1] = img.size[1] if img.size[1] > max_size[1] else max_size[1]
+            png_header = read_png_header(join(folder_path, file))
+            if png_header is not None:
+                width, height = png_header
+            else:
+                img = bpy.data.images.load(join(folder_path, file))
+                width, height = img.size # Read RNA size array once
+                bpy.data.images.remove(img)
             
-            images.append(img)
+            max_size[0] = width if width > max_size[0] else max_size[0]
+            max_size[1] = height if height > max_size[1] else max_size[1]
 
         # Create tilemap image
         tilemap_size = [max_size[0] * column_count, max_size[1] * row_count]
@@ -322,36 +425,36 @@ class TEXTURE_ATLAS_GENERATOR_OT_generate_texture_atlas(bpy.types.Operator):
         tilemap_img = bpy.data.images.new(output_name, tilemap_size[0], tilemap_size[1])
 
         # Copy tile pixel data into tilemap image
-        tilemap_pixels = [0.0, 0.0, 0.0, 1.0] * tilemap_size[0] * tilemap_size[1]
+        if np is not None:
+            tilemap_pixels = np.zeros((tilemap_size[1], tilemap_size[0], 4), dtype=np.float32) # Rows of R G B A pixels
+            tilemap_pixels[..., 3] = 1.0 # Opaque black background
+            tilemap_grid = tilemap_pixels.reshape((row_count, max_size[1], column_count, max_size[0], 4)) # View, addressed by tile
+            tile_buffer = np.empty(max_size[0] * max_size[1] * 4, dtype=np.float32) # Reused for every tile
+        else:
+            # Unboxed C floats, sequential list of R G B A components
+            tilemap_pixels = array('f', [0.0, 0.0, 0.0, 1.0]) * (tilemap_size[0] * tilemap_size[1])
+            tilemap_view = memoryview(tilemap_pixels)
+            tile_buffer = array('f', [0.0]) * (max_size[0] * max_size[1] * 4)
+        file_paths = [join(folder_path, file) for file in files]
+        row_indices = [i // column_count for i in range(0, len(files))]
+        if row_order == 'top_to_bottom':
+            row_indices = [row_count - 1 - row_index for row_index in row_indices]
         for i in range(0, len(files)):
             wm.progress_update(i)
             
-            tile_img = images[i]
-            tile_size = tile_img.size
-            tile_pixels = tile_img.pixels # Sequential list of R G B A components
+            tile_img = bpy.data.images.load(file_paths[i])
+            tile_width, tile_height = tile_img.size
+            tile_view = memoryview(tile_buffer)[:tile_width * tile_height * 4]
+            tile_img.pixels.foreach_get(tile_view)
+            bpy.data.images.remove(tile_img) # Pixels are in tile_buffer now
             
-            row_index = row_count - 1 - floor(i / column_count) if row_order == 'top_to_bottom' else floor(i / column_count)
-            column_index = i % column_count
-            
-            for y in range(0, tile_size[1]):
-                # Each line of tile image
-                tile_offset = y * tile_size[0]
-                tile_x1 = tile_offset * 4
-                tile_x2 = tile_x1 + tile_size[0] * 4
-                
-                # Destination line on tilemap image
-                tilemap_offset = row_index * tilemap_size[0] * tile_size[1] + column_index * tile_size[0]
-                tilemap_x1 = (tilemap_offset + y * tilemap_size[0]) * 4
-                tilemap_x2 = tilemap_x1 + tile_size[0] * 4
-                
-                # Copy tile line to tilemap line
-                tilemap_pixels[tilemap_x1:tilemap_x2] = tile_pixels[tile_x1:tile_x2]
-                
-        tilemap_img.pixels = tilemap_pixels
+            if np is not None:
+                tile_pixels = tile_buffer[:tile_width * tile_height * 4].reshape((tile_height, tile_width, 4))
+                copy_tile_to_tilemap(tilemap_grid, tile_pixels, row_indices[i], i % column_count)
+            else:
+                copy_tile_to_tilemap_buffer(tilemap_view, tilemap_size[0], tile_view, (tile_width, tile_height), max_size, row_indices[i], i % column_count)
         
-        # Cleanup
-        for img in images:
-            bpy.data.images.remove(img)
+        tilemap_img.pixels.foreach_set(tilemap_pixels.ravel() if np is not None else tilemap_pixels)
         
         if context.area.type == 'IMAGE_EDITOR':
             # Operator called in image editor, set active image to newly generated one